@@ -1,5 +1,10 @@
-import re
+import sys
+import socket
+import struct
 import ipaddress
+from collections.abc import Callable
+from functools import lru_cache
+from typing import NamedTuple
 
 # MAIN INPUT : hard-code a single input
 single_input_str = "192.0.2.10/27"
@@ -9,29 +14,81 @@ single_input_str = "192.0.2.10/27"
 # ============================================================
 
 class C:
-    HEADER  = "\033[95m"
-    OKBLUE  = "\033[94m"
-    OKCYAN  = "\033[96m"
-    OKGREEN = "\033[92m"
-    WARNING = "\033[93m"
-    FAIL    = "\033[91m"
-    ENDC    = "\033[0m"
-    BOLD    = "\033[1m"
+    # no escape codes when output is redirected to a file or pipe
+    if sys.stdout.isatty():
+        HEADER  = "\033[95m"
+        OKBLUE  = "\033[94m"
+        OKCYAN  = "\033[96m"
+        OKGREEN = "\033[92m"
+        WARNING = "\033[93m"
+        FAIL    = "\033[91m"
+        ENDC    = "\033[0m"
+        BOLD    = "\033[1m"
+    else:
+        HEADER = OKBLUE = OKCYAN = OKGREEN = WARNING = FAIL = ENDC = BOLD = ""
+
+# ============================================================
+#               32-bit Network Representation
+# ============================================================
+
+class Net(NamedTuple):
+    """
+    IPv4 network as a 32-bit network address int plus prefix length.
+
+    Build it with net_of(), which masks off the host bits; a Net whose
+    addr has host bits set is rejected by describe_subnet/explain_network.
+    """
+    addr: int
+    prefix: int
+
+def net_of(ip_int: int, prefix: int) -> Net:
+    """Return the network containing ip_int for the given prefix."""
+    if not (0 <= prefix <= 32):
+        raise ValueError("Prefix must be between 0 and 32.")
+    if not (0 <= ip_int <= 0xffffffff):
+        raise ValueError(f"IP int out of range: {ip_int}")
+    return Net(ip_int & _MASK_INT_TABLE[prefix], prefix)
+
+def _check_net(n: Net) -> None:
+    """Raise ValueError unless n is a valid, boundary-aligned network."""
+    if not (0 <= n.prefix <= 32):
+        raise ValueError("Prefix must be between 0 and 32.")
+    if not (0 <= n.addr <= 0xffffffff) or n.addr & ~_MASK_INT_TABLE[n.prefix]:
+        raise ValueError(
+            f"Not a network address for /{n.prefix}: {n.addr} (build it with net_of())."
+        )
+
+def netmask(n: Net) -> int:
+    return _MASK_INT_TABLE[n.prefix]
+
+def broadcast(n: Net) -> int:
+    return n.addr | (~_MASK_INT_TABLE[n.prefix] & 0xffffffff)
+
+def num_addresses(n: Net) -> int:
+    return 1 << (32 - n.prefix)
 
 # ============================================================
 #                    Parsing Function
 # ============================================================
 
-def parse_network(input_str: str) -> ipaddress.IPv4Network:
+# separators accepted between IP and mask, all mapped to a space
+_SEP_TABLE = str.maketrans("/-:", "   ")
+
+@lru_cache(maxsize=1024)
+def parse_network(input_str: str) -> tuple[int, Net]:
     """
     Parse input containing either:
     - CIDR notation  (59.89.212.216/14)
     - Full mask      (59.89.212.216 255.252.0.0)
 
     Accepted separators for mask: " ", "/", "-", ":"
+
+    ipaddress is only used here, to validate the input; returns
+    (original IP as int, Net) so callers don't need to re-parse.
+    Results are cached, since both values are immutable.
     """
     # normalize separators
-    cleaned = re.sub(r"[/\-:]+", " ", input_str.strip())
+    cleaned = input_str.strip().translate(_SEP_TABLE)
     parts = cleaned.split()
 
     if len(parts) != 2:
@@ -44,7 +101,7 @@ def parse_network(input_str: str) -> ipaddress.IPv4Network:
 
     # validate IP
     try:
-        ipaddress.IPv4Address(ip_part)
+        ip_int = int(ipaddress.IPv4Address(ip_part))
     except ipaddress.AddressValueError:
         raise ValueError(f"Invalid IP: {ip_part}")
 
@@ -53,75 +110,111 @@ def parse_network(input_str: str) -> ipaddress.IPv4Network:
         cidr_value = int(mask_part)
         if not (0 <= cidr_value <= 32):
             raise ValueError("CIDR must be between 0-32.")
-        return ipaddress.IPv4Network(f"{ip_part}/{cidr_value}", strict=False)
+        return ip_int, net_of(ip_int, cidr_value)
 
     # CASE 2 — full mask
     try:
-        ipaddress.IPv4Address(mask_part)
+        mask_int = int(ipaddress.IPv4Address(mask_part))
     except ipaddress.AddressValueError:
         raise ValueError(f"Invalid subnet mask: {mask_part}")
 
     # convert long mask → CIDR
-    try:
-        prefix_len = ipaddress.IPv4Network(f"0.0.0.0/{mask_part}").prefixlen
-    except (ipaddress.NetmaskValueError, ValueError):
+    # contiguous 1s then 0s ⇔ inverted mask is of the form 0…01…1
+    inv = ~mask_int & 0xffffffff
+    if inv & (inv + 1):
         raise ValueError("Mask is not contiguous.")
+    prefix_len = mask_int.bit_count()
 
-    return ipaddress.IPv4Network(f"{ip_part}/{prefix_len}", strict=False)
+    return ip_int, net_of(ip_int, prefix_len)
 
 # ============================================================
 #                 Subnet Description Function
 # ============================================================
 
-def describe_subnet(network: ipaddress.IPv4Network) -> dict:
+def describe_subnet(network: Net) -> dict:
+    _check_net(network)
+    bcast_int = broadcast(network)
+    size = num_addresses(network)
+
     # Compute first/last host without listing entire host set
-    if network.num_addresses > 2:
-        first = ipaddress.IPv4Address(int(network.network_address) + 1)
-        last = ipaddress.IPv4Address(int(network.broadcast_address) - 1)
-        first_str = str(first)
-        last_str = str(last)
+    if size > 2:
+        first_str = _int_to_dotted(network.addr + 1)
+        last_str = _int_to_dotted(bcast_int - 1)
     else:
         first_str = "N/A"
         last_str = "N/A"
 
     return {
-        "Network": str(network.network_address),
-        "CIDR": f"/{network.prefixlen}",
-        "Netmask": str(network.netmask),
+        "Network": _int_to_dotted(network.addr),
+        "CIDR": f"/{network.prefix}",
+        "Netmask": _int_to_dotted(netmask(network)),
         "First Host": first_str,
         "Last Host": last_str,
-        "Broadcast": str(network.broadcast_address),
-        "Next Subnet": str(network.network_address + network.num_addresses),
-        "Total Addresses": network.num_addresses,
-        "Usable Hosts": max(network.num_addresses - 2, 0),
+        "Broadcast": _int_to_dotted(bcast_int),
+        "Next Subnet": _next_subnet_str(network.addr, size),
+        "Total Addresses": size,
+        "Usable Hosts": max(size - 2, 0),
     }
 
+def describe_subnets_bulk(ips, prefixes) -> list[dict]:
+    """
+    Describe many subnets from parallel sequences of 32-bit IP ints
+    and prefix lengths. Each row has the same keys as describe_subnet,
+    so it can go straight to print_subnet_info.
+    """
+    if len(ips) != len(prefixes):
+        raise ValueError("ips and prefixes must be the same length.")
+    return [describe_subnet(net_of(ip, prefix)) for ip, prefix in zip(ips, prefixes)]
+
 # ============================================================
 #                 Pretty Colored Printer (Summary)
 # ============================================================
 
+# (key, colored "key:" prefix) for every row describe_subnet returns
+_ROW_TEMPLATES = tuple(
+    (key, f"{C.BOLD}{C.OKGREEN if 'Host' in key else C.OKCYAN}{key:<15}:{C.ENDC} ")
+    for key in (
+        "Network", "CIDR", "Netmask", "First Host", "Last Host",
+        "Broadcast", "Next Subnet", "Total Addresses", "Usable Hosts",
+    )
+)
+
 def print_subnet_info(info: dict, label="TEST"):
-    print(f"\n{C.BOLD}{C.OKBLUE}========== {label} =========={C.ENDC}")
-    for key, value in info.items():
-        color = C.OKGREEN if "Host" in key else C.OKCYAN
-        print(f"{C.BOLD}{color}{key:<15}:{C.ENDC} {value}")
+    out = []
+    out.append(f"\n{C.BOLD}{C.OKBLUE}========== {label} =========={C.ENDC}")
+    for key, row_prefix in _ROW_TEMPLATES:
+        out.append(f"{row_prefix}{info[key]}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 # ============================================================
 #              Binary Helpers & Transition Logic
 # ============================================================
 
+_BIN8 = tuple(format(v, "08b") for v in range(256))
+_OCTET_LABELS = ("1st", "2nd", "3rd", "4th")
+
 def byte_to_bin_str(value: int) -> str:
     """Return an 8-bit binary string for a byte."""
-    return f"{value:08b}"
+    return _BIN8[value]
+
+def _int_to_dotted(n: int) -> str:
+    """Return dotted decimal for a 32-bit int without building an IPv4Address."""
+    return socket.inet_ntoa(struct.pack("!I", n))
 
-def ip_to_bin_str(ip: ipaddress.IPv4Address) -> str:
+def _next_subnet_str(net_int: int, size: int) -> str:
+    """Return the next subnet's address, or "N/A" past 255.255.255.255."""
+    next_int = net_int + size
+    if next_int > 0xffffffff:
+        return "N/A"
+    return _int_to_dotted(next_int)
+
+def ip_to_bin_str(ip: int) -> str:
     """Return IP in binary as 'xxxxxxxx/xxxxxxxx/...' per octet."""
-    return "/".join(byte_to_bin_str(int(octet)) for octet in str(ip).split("."))
+    b = f"{int(ip):032b}"
+    return f"{b[0:8]}/{b[8:16]}/{b[16:24]}/{b[24:32]}"
 
-def mask_from_prefix(prefix: int) -> tuple[int, int, int, int]:
-    """Return dotted decimal netmask bytes from prefix length."""
-    if not (0 <= prefix <= 32):
-        raise ValueError("Prefix must be between 0 and 32.")
+def _compute_mask_bytes(prefix: int) -> tuple[int, int, int, int]:
+    """Build netmask bytes for a prefix (no range check)."""
     if prefix == 0:
         mask = 0
     else:
@@ -133,12 +226,18 @@ def mask_from_prefix(prefix: int) -> tuple[int, int, int, int]:
         mask & 0xff,
     )
 
-def transition_info(prefix: int):
-    """
-    Given a prefix, return:
-      - transition_index: 0-3 or None if prefix is multiple of 8 or 0
-      - bits_in_transition: number of 1s in the transition octet (0-8)
-    """
+# only 33 possible prefixes, so build every mask once at import
+_MASK_TABLE = tuple(_compute_mask_bytes(p) for p in range(33))
+_MASK_INT_TABLE = tuple(int.from_bytes(bytes(m), "big") for m in _MASK_TABLE)
+
+def mask_from_prefix(prefix: int) -> tuple[int, int, int, int]:
+    """Return dotted decimal netmask bytes from prefix length."""
+    if not (0 <= prefix <= 32):
+        raise ValueError("Prefix must be between 0 and 32.")
+    return _MASK_TABLE[prefix]
+
+def _compute_transition_info(prefix: int):
+    """Build (transition_index, bits_in_transition) for a prefix (no range check)."""
     if prefix == 0 or prefix % 8 == 0:
         return None, 0
     full_bytes = prefix // 8
@@ -146,130 +245,201 @@ def transition_info(prefix: int):
     transition_index = full_bytes  # 0-based index
     return transition_index, bits_in_transition
 
+_TRANSITION_TABLE = tuple(_compute_transition_info(p) for p in range(33))
+
+def transition_info(prefix: int):
+    """
+    Given a prefix, return:
+      - transition_index: 0-3 or None if prefix is multiple of 8 or 0
+      - bits_in_transition: number of 1s in the transition octet (0-8)
+
+    Starting from the mask side instead, bits_in_transition is just
+    mask_byte.bit_count() of the transition octet.
+    """
+    if not (0 <= prefix <= 32):
+        raise ValueError("Prefix must be between 0 and 32.")
+    return _TRANSITION_TABLE[prefix]
+
 # ============================================================
 #            Detailed Explanation (Colored Output)
 # ============================================================
 
-def explain_network(original_ip: ipaddress.IPv4Address,
-                    network: ipaddress.IPv4Network):
+# one specialized explainer per prefix, built on first use
+_EXPLAIN_CACHE: dict[int, Callable] = {}
+
+def _build_explain(prefix: int) -> Callable:
     """
-    Print a detailed, colored explanation of how the subnet is
-    calculated from the original IP and the network definition.
+    Return an explainer for a single prefix length, with every line
+    that depends only on the prefix (netmask, binary mask, transition
+    byte, host counts) formatted once up front.
     """
-    prefix = network.prefixlen
     netmask_bytes = mask_from_prefix(prefix)
-    netmask = ipaddress.IPv4Address(".".join(str(b) for b in netmask_bytes))
-
-    # Header
-    print(f"\n{C.BOLD}{C.HEADER}----- DETAILED EXPLANATION -----{C.ENDC}")
-    print(f"{C.BOLD}{C.OKCYAN}Input IP      :{C.ENDC} {original_ip}")
-    print(f"{C.BOLD}{C.OKCYAN}Normalized CIDR:{C.ENDC} {network.network_address}/{prefix}")
-    print(f"{C.BOLD}{C.OKCYAN}Netmask       :{C.ENDC} {netmask}")
-    print()
-
-    # BASE and SUBMASK in binary
-    print(f"{C.BOLD}{C.OKBLUE}                BASE{C.ENDC}")
-    print(f"{C.OKCYAN}{ip_to_bin_str(ipaddress.IPv4Address('0.0.0.0'))}{C.ENDC}")
-    print()
-    print(f"{C.BOLD}{C.OKBLUE}                SUBMASK{C.ENDC}")
-    print(f"{C.OKCYAN}{ip_to_bin_str(netmask)}{C.ENDC}")
-    print()
+    mask_int = _MASK_INT_TABLE[prefix]
+    size = 1 << (32 - prefix)
+    has_hosts = size > 2
+
+    # Netmask line through the Step 1 heading
+    mask_block = [
+        f"{C.BOLD}{C.OKCYAN}Netmask       :{C.ENDC} {_int_to_dotted(mask_int)}",
+        "",
+        # BASE and SUBMASK in binary
+        f"{C.BOLD}{C.OKBLUE}                BASE{C.ENDC}",
+        f"{C.OKCYAN}{ip_to_bin_str(0)}{C.ENDC}",
+        "",
+        f"{C.BOLD}{C.OKBLUE}                SUBMASK{C.ENDC}",
+        f"{C.OKCYAN}{ip_to_bin_str(mask_int)}{C.ENDC}",
+        "",
+    ]
 
     # Transition byte info
     t_index, bits_in_transition = transition_info(prefix)
     if t_index is not None:
         t_byte = netmask_bytes[t_index]
-        print(f"{C.BOLD}{C.OKGREEN}Transition byte index (0-based):{C.ENDC} {t_index}")
-        print(f"{C.BOLD}{C.OKGREEN}Bits set in transition byte    :{C.ENDC} {bits_in_transition}")
-        print(f"{C.BOLD}{C.OKGREEN}transition byte     ->{C.ENDC} {byte_to_bin_str(t_byte)}")
-        print(
+        mask_block += [
+            f"{C.BOLD}{C.OKGREEN}Transition byte index (0-based):{C.ENDC} {t_index}",
+            f"{C.BOLD}{C.OKGREEN}Bits set in transition byte    :{C.ENDC} {bits_in_transition}",
+            f"{C.BOLD}{C.OKGREEN}transition byte     ->{C.ENDC} {byte_to_bin_str(t_byte)}",
             f"{C.BOLD}{C.OKGREEN}the value of the byte ->{C.ENDC} "
-            f"{byte_to_bin_str(t_byte)} = {t_byte}"
-        )
+            f"{byte_to_bin_str(t_byte)} = {t_byte}",
+        ]
     else:
-        print(f"{C.BOLD}{C.WARNING}No partial transition byte (prefix multiple of 8 or /0).{C.ENDC}")
-    print()
-
-    # Step 1: Network Address calculation
-    print(f"{C.BOLD}{C.OKBLUE}Step 1: Network Address (IP AND Netmask){C.ENDC}")
-    ip_octets  = [int(o) for o in str(original_ip).split(".")]
-    net_octets = [int(o) for o in str(network.network_address).split(".")]
-
-    for i, (ip_o, mask_o, net_o) in enumerate(zip(ip_octets, netmask_bytes, net_octets), start=1):
-        idx_label = {1: "1st", 2: "2nd", 3: "3rd"}.get(i, f"{i}th")
-        print(
-            f"{C.BOLD}{C.OKCYAN}{idx_label} byte:{C.ENDC} "
-            f"{ip_o:3d} ({byte_to_bin_str(ip_o)})  AND  "
-            f"{mask_o:3d} ({byte_to_bin_str(mask_o)})  =  "
-            f"{C.OKGREEN}{net_o:3d} ({byte_to_bin_str(net_o)}){C.ENDC}"
+        mask_block.append(
+            f"{C.BOLD}{C.WARNING}No partial transition byte (prefix multiple of 8 or /0).{C.ENDC}"
         )
-
-    print(
-        f"\n{C.BOLD}{C.OKGREEN}Full network IP:{C.ENDC} "
-        f"{C.OKGREEN}{network.network_address}{C.ENDC}"
+    mask_block += [
+        "",
+        f"{C.BOLD}{C.OKBLUE}Step 1: Network Address (IP AND Netmask){C.ENDC}",
+    ]
+
+    # mask column of the Step 1 rows
+    m0, m1, m2, m3 = (f"{m:3d} ({_BIN8[m]})" for m in netmask_bytes)
+
+    usable_line = (
+        f"{C.OKCYAN}- Usable hosts = Total addresses - 2 = "
+        f"{size} - 2 = "
+        f"{C.OKGREEN}{size - 2}{C.ENDC}"
+    )
+    no_first_line = (
+        f"{C.WARNING}- This subnet has no usable hosts by classical rules "
+        f"(/31 or /32).{C.ENDC}"
     )
-    print()
-
-    # Step 2: First Host
-    print(f"{C.BOLD}{C.OKBLUE}Step 2: First Host{C.ENDC}")
-    if network.num_addresses > 2:
-        first_host = ipaddress.IPv4Address(int(network.network_address) + 1)
-        print(
-            f"{C.OKCYAN}- First host = network IP + 1 → "
-            f"{C.OKGREEN}{first_host}{C.ENDC}"
+    no_last_line = f"{C.WARNING}- No last host (no usable host addresses).{C.ENDC}"
+
+    def explain(original_ip: int, network: Net):
+        net_int = network.addr
+        bcast_int = net_int | (~mask_int & 0xffffffff)
+        net_str = _int_to_dotted(net_int)
+        bcast_str = _int_to_dotted(bcast_int)
+
+        # Header
+        out = [
+            f"\n{C.BOLD}{C.HEADER}----- DETAILED EXPLANATION -----{C.ENDC}",
+            f"{C.BOLD}{C.OKCYAN}Input IP      :{C.ENDC} {_int_to_dotted(original_ip)}",
+            f"{C.BOLD}{C.OKCYAN}Normalized CIDR:{C.ENDC} {net_str}/{prefix}",
+        ]
+        out += mask_block
+
+        # Step 1: Network Address calculation
+        ip_octets  = original_ip.to_bytes(4, "big")
+        net_octets = net_int.to_bytes(4, "big")
+
+        # always exactly 4 octets, so the rows are written out directly
+        out.append(
+            f"{C.BOLD}{C.OKCYAN}{_OCTET_LABELS[0]} byte:{C.ENDC} "
+            f"{ip_octets[0]:3d} ({_BIN8[ip_octets[0]]})  AND  {m0}  =  "
+            f"{C.OKGREEN}{net_octets[0]:3d} ({_BIN8[net_octets[0]]}){C.ENDC}"
         )
-    else:
-        first_host = None
-        print(
-            f"{C.WARNING}- This subnet has no usable hosts by classical rules "
-            f"(/31 or /32).{C.ENDC}"
+        out.append(
+            f"{C.BOLD}{C.OKCYAN}{_OCTET_LABELS[1]} byte:{C.ENDC} "
+            f"{ip_octets[1]:3d} ({_BIN8[ip_octets[1]]})  AND  {m1}  =  "
+            f"{C.OKGREEN}{net_octets[1]:3d} ({_BIN8[net_octets[1]]}){C.ENDC}"
         )
-    print()
-
-    # Step 3: Last Host
-    print(f"{C.BOLD}{C.OKBLUE}Step 3: Last Host calculation{C.ENDC}")
-    if network.num_addresses > 2:
-        last_host = ipaddress.IPv4Address(int(network.broadcast_address) - 1)
-        print(
-            f"{C.OKCYAN}- Last Host = broadcast - 1 → "
-            f"{C.OKGREEN}{last_host}{C.ENDC}"
+        out.append(
+            f"{C.BOLD}{C.OKCYAN}{_OCTET_LABELS[2]} byte:{C.ENDC} "
+            f"{ip_octets[2]:3d} ({_BIN8[ip_octets[2]]})  AND  {m2}  =  "
+            f"{C.OKGREEN}{net_octets[2]:3d} ({_BIN8[net_octets[2]]}){C.ENDC}"
         )
-        print(
-            f"{C.OKCYAN}- Usable hosts = Total addresses - 2 = "
-            f"{network.num_addresses} - 2 = "
-            f"{C.OKGREEN}{network.num_addresses - 2}{C.ENDC}"
+        out.append(
+            f"{C.BOLD}{C.OKCYAN}{_OCTET_LABELS[3]} byte:{C.ENDC} "
+            f"{ip_octets[3]:3d} ({_BIN8[ip_octets[3]]})  AND  {m3}  =  "
+            f"{C.OKGREEN}{net_octets[3]:3d} ({_BIN8[net_octets[3]]}){C.ENDC}"
         )
-    else:
-        last_host = None
-        print(f"{C.WARNING}- No last host (no usable host addresses).{C.ENDC}")
-    print()
-
-    # Step 4: Broadcast Address
-    print(f"{C.BOLD}{C.OKBLUE}Step 4: Broadcast Address{C.ENDC}")
-    print(
-        f"{C.OKCYAN}- Broadcast = all host bits set to 1 → "
-        f"{C.OKGREEN}{network.broadcast_address}{C.ENDC}"
-    )
-    if last_host is not None:
-        print(
-            f"{C.OKCYAN}- Also: broadcast = last host + 1 → "
-            f"{last_host} + 1 = {C.OKGREEN}{network.broadcast_address}{C.ENDC}"
+
+        out.append(
+            f"\n{C.BOLD}{C.OKGREEN}Full network IP:{C.ENDC} "
+            f"{C.OKGREEN}{net_str}{C.ENDC}"
         )
-    print()
-
-    # Step 5: Next Subnet
-    print(f"{C.BOLD}{C.OKBLUE}Step 5: Next Subnet{C.ENDC}")
-    next_net_int = int(network.network_address) + network.num_addresses
-    next_net_ip = ipaddress.IPv4Address(next_net_int)
-    print(
-        f"{C.OKCYAN}- Next subnet starts at network_address + block size{C.ENDC}"
-    )
-    print(
-        f"  {C.OKCYAN}= {network.network_address} + {network.num_addresses}"
-        f"{C.ENDC}"
-    )
-    print(f"  {C.OKCYAN}= {C.OKGREEN}{next_net_ip}{C.ENDC}")
-    print(f"{C.BOLD}{C.HEADER}----- END EXPLANATION -----{C.ENDC}\n")
+        out.append("")
+
+        # Step 2: First Host
+        out.append(f"{C.BOLD}{C.OKBLUE}Step 2: First Host{C.ENDC}")
+        if has_hosts:
+            first_host = _int_to_dotted(net_int + 1)
+            out.append(
+                f"{C.OKCYAN}- First host = network IP + 1 → "
+                f"{C.OKGREEN}{first_host}{C.ENDC}"
+            )
+        else:
+            out.append(no_first_line)
+        out.append("")
+
+        # Step 3: Last Host
+        out.append(f"{C.BOLD}{C.OKBLUE}Step 3: Last Host calculation{C.ENDC}")
+        if has_hosts:
+            last_host = _int_to_dotted(bcast_int - 1)
+            out.append(
+                f"{C.OKCYAN}- Last Host = broadcast - 1 → "
+                f"{C.OKGREEN}{last_host}{C.ENDC}"
+            )
+            out.append(usable_line)
+        else:
+            last_host = None
+            out.append(no_last_line)
+        out.append("")
+
+        # Step 4: Broadcast Address
+        out.append(f"{C.BOLD}{C.OKBLUE}Step 4: Broadcast Address{C.ENDC}")
+        out.append(
+            f"{C.OKCYAN}- Broadcast = all host bits set to 1 → "
+            f"{C.OKGREEN}{bcast_str}{C.ENDC}"
+        )
+        if last_host is not None:
+            out.append(
+                f"{C.OKCYAN}- Also: broadcast = last host + 1 → "
+                f"{last_host} + 1 = {C.OKGREEN}{bcast_str}{C.ENDC}"
+            )
+        out.append("")
+
+        # Step 5: Next Subnet
+        out.append(f"{C.BOLD}{C.OKBLUE}Step 5: Next Subnet{C.ENDC}")
+        next_net_ip = _next_subnet_str(net_int, size)
+        out.append(
+            f"{C.OKCYAN}- Next subnet starts at network_address + block size{C.ENDC}"
+        )
+        out.append(
+            f"  {C.OKCYAN}= {net_str} + {size}"
+            f"{C.ENDC}"
+        )
+        if next_net_ip == "N/A":
+            out.append(f"  {C.WARNING}= past 255.255.255.255 (no next subnet){C.ENDC}")
+        else:
+            out.append(f"  {C.OKCYAN}= {C.OKGREEN}{next_net_ip}{C.ENDC}")
+        out.append(f"{C.BOLD}{C.HEADER}----- END EXPLANATION -----{C.ENDC}\n")
+        sys.stdout.write("\n".join(out) + "\n")
+
+    return explain
+
+def explain_network(original_ip: int, network: Net):
+    """
+    Print a detailed, colored explanation of how the subnet is
+    calculated from the original IP and the network definition.
+    """
+    _check_net(network)
+    prefix = network.prefix
+    fn = _EXPLAIN_CACHE.get(prefix)
+    if fn is None:
+        fn = _EXPLAIN_CACHE[prefix] = _build_explain(prefix)
+    fn(original_ip, network)
 
 # ============================================================
 #     Wrapper: Take raw input string, parse, and explain
@@ -280,14 +450,7 @@ def explain_input_subnet(input_str: str):
     Parse user input, compute network, and print a detailed explanation.
     Uses the IP part from the input as the 'original IP'.
     """
-    cleaned = re.sub(r"[/\-:]+", " ", input_str.strip())
-    parts = cleaned.split()
-    if len(parts) != 2:
-        raise ValueError(f"Bad format for explanation: '{input_str}'")
-
-    ip_part, _ = parts
-    original_ip = ipaddress.IPv4Address(ip_part)
-    network = parse_network(input_str)
+    original_ip, network = parse_network(input_str)
     explain_network(original_ip, network)
 
 # ============================================================
@@ -342,7 +505,7 @@ def run_subnet_checks(test_cases=None, single_input: str | None = None) -> None:
         print(f"{C.OKBLUE}{C.BOLD}Running Subnet Test Suite (list)...{C.ENDC}")
         for case in test_cases:
             try:
-                net = parse_network(case)
+                _, net = parse_network(case)
                 info = describe_subnet(net)
                 print_subnet_info(info, label=f"TEST #{test_number}   INPUT='{case}'")
 
@@ -360,7 +523,7 @@ def run_subnet_checks(test_cases=None, single_input: str | None = None) -> None:
     if single_input:
         print(f"\n{C.OKBLUE}{C.BOLD}Running Single IP/Subnet Input...{C.ENDC}")
         try:
-            net = parse_network(single_input)
+            _, net = parse_network(single_input)
             info = describe_subnet(net)
             print_subnet_info(info, label=f"SINGLE INPUT='{single_input}'")
 